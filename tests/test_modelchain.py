@@ -272,3 +272,22 @@ class TestModelChain:
             test_mc = mc.ModelChain(wt.WindTurbine(**test_turbine),
                                     **test_modelchain)
             test_mc.run_model(weather_df)
+
+    def test_run_model_batch(self):
+        weather_df = pd.DataFrame(
+            np.array([[267, 101125, 5.0, 0.15], [268, 101000, 6.5, 0.15]]),
+            index=pd.date_range('1/1/2012', periods=2, freq='H'),
+            columns=[np.array(['temperature', 'pressure', 'wind_speed',
+                               'roughness_length']),
+                     np.array([2, 0, 10, 0])])
+        weather_df_2 = weather_df.copy()
+        weather_df_2.index = pd.date_range('1/1/2013', periods=2, freq='H')
+        test_mc = mc.ModelChain(wt.WindTurbine(**self.test_turbine))
+        power_output_exp = pd.concat(
+            [test_mc.run_model(weather_df).power_output,
+             test_mc.run_model(weather_df_2).power_output])
+        test_mc.run_model_batch([weather_df, weather_df_2])
+        assert_series_equal(test_mc.power_output, power_output_exp)
+        # Raise ValueError due to empty list of weather data
+        with pytest.raises(ValueError):
+            test_mc.run_model_batch([])
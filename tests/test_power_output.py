@@ -6,7 +6,8 @@ from pandas.util.testing import assert_series_equal
 
 from windpowerlib.power_output import (power_coefficient_curve,
                                        power_curve,
-                                       power_curve_density_correction)
+                                       power_curve_density_correction,
+                                       _CHUNK_SIZE)
 
 
 class TestPowerOutput:
@@ -171,7 +172,35 @@ class TestPowerOutput:
                         power_output_exp)
         assert isinstance(power_curve(**parameters), np.ndarray)
 
+        # Test constant density as float
+        parameters['density'] = 1.3
+        assert_allclose(power_curve_density_correction(**parameters),
+                        power_output_exp)
+
         # Raise TypeError due to density is None
         with pytest.raises(TypeError):
             parameters['density'] = None
             power_curve_density_correction(**parameters)
+
+        # Test nan density
+        parameters['density'] = np.array([1.3, np.nan, 1.3])
+        power_output_exp = np.array([0.0, np.nan, 0.0])
+        assert_allclose(power_curve_density_correction(**parameters),
+                        power_output_exp)
+
+    def test_power_curve_density_correction_chunks(self):
+        # More time steps than processed at once
+        wind_speed = np.linspace(0.0, 30.0, _CHUNK_SIZE + 100)
+        density = np.linspace(1.1, 1.3, _CHUNK_SIZE + 100)
+        power_curve_wind_speeds = np.array([3.0, 5.0, 8.0, 12.0, 15.0, 25.0])
+        power_curve_values = np.array([0.0, 100.0, 800.0, 2000.0, 2000.0,
+                                       2000.0])
+        power_output_exp = [np.interp(
+            wind_speed[i], power_curve_wind_speeds * (1.225 / density[i]) ** (
+                np.interp(power_curve_wind_speeds, [7.5, 12.5],
+                          [1/3, 2/3])),
+            power_curve_values, left=0, right=0)
+            for i in range(len(wind_speed))]
+        assert_allclose(power_curve_density_correction(
+            wind_speed, power_curve_wind_speeds, power_curve_values, density),
+            power_output_exp)
@@ -1,11 +1,12 @@
 import pandas as pd
 import numpy as np
-from pandas.util.testing import assert_series_equal
+from pandas.util.testing import assert_series_equal, assert_frame_equal
 
 import windpowerlib.wind_farm as wf
 import windpowerlib.wind_turbine as wt
 import windpowerlib.wind_turbine_cluster as wtc
 import windpowerlib.turbine_cluster_modelchain as tc_mc
+import windpowerlib.modelchain as mc
 
 
 class TestTurbineClusterModelChain:
@@ -186,3 +187,125 @@ class TestTurbineClusterModelChain:
             power_plant=test_cluster, **parameters)
         test_tc_mc.run_model(self.weather_df)
         assert_series_equal(test_tc_mc.power_output, power_output_exp)
+
+    def test_turbulence_intensity_with_nan(self):
+        class RecordingWindFarm(wf.WindFarm):
+            def assign_power_curve(self, **kwargs):
+                self.turbulence_intensity = kwargs['turbulence_intensity']
+                return super(RecordingWindFarm, self).assign_power_curve(
+                    **kwargs)
+
+        weather_df = self.weather_df.copy()
+        weather_df[('turbulence_intensity', 100)] = [0.1, np.nan]
+        test_farm = RecordingWindFarm(**self.test_farm)
+        test_tc_mc = tc_mc.TurbineClusterModelChain(
+            power_plant=test_farm, wake_losses_model=None)
+        test_tc_mc.assign_power_curve(weather_df)
+        assert test_farm.turbulence_intensity == 0.1
+
+    def test_power_curve_cache(self):
+        test_tc_mc = tc_mc.TurbineClusterModelChain(
+            power_plant=wtc.WindTurbineCluster(**self.test_cluster),
+            wake_losses_model=None)
+        test_tc_mc.assign_power_curve(self.weather_df)
+        power_curve_exp = test_tc_mc.power_plant.power_curve.copy()
+        test_tc_mc.power_plant.power_curve = None
+        test_tc_mc.assign_power_curve(self.weather_df)
+        assert_frame_equal(test_tc_mc.power_plant.power_curve,
+                           power_curve_exp)
+        np.testing.assert_array_equal(test_tc_mc._power_curve_arrays[1],
+                                      power_curve_exp['wind_speed'].values)
+        np.testing.assert_array_equal(test_tc_mc._power_curve_arrays[2],
+                                      power_curve_exp['value'].values)
+        test_tc_mc.invalidate_cache()
+        assert test_tc_mc._power_curve_arrays is None
+        assert test_tc_mc._hub_height_ready is False
+
+    def test_calculate_power_output_new_power_plant(self):
+        test_tc_mc = tc_mc.TurbineClusterModelChain(
+            power_plant=wf.WindFarm(**self.test_farm), wake_losses_model=None)
+        test_tc_mc.run_model(self.weather_df)
+        # New power plant with an already assigned power curve
+        test_wind_farm = wf.WindFarm(**self.test_farm_2)
+        test_wind_farm.mean_hub_height()
+        test_wind_farm.assign_power_curve(wake_losses_model=None)
+        test_tc_mc.power_plant = test_wind_farm
+        wind_speed = pd.Series([8.0, 10.0])
+        power_output_exp = mc.ModelChain(
+            test_wind_farm).calculate_power_output(wind_speed, None)
+        assert_series_equal(
+            test_tc_mc.calculate_power_output(wind_speed, None),
+            power_output_exp)
+
+    def test_power_curve_cache_efficiency_changed(self):
+        parameters = {'wake_losses_model': 'constant_efficiency'}
+        test_wind_farm = wf.WindFarm(**self.test_farm)
+        test_wind_farm.efficiency = 0.9
+        test_tc_mc = tc_mc.TurbineClusterModelChain(
+            power_plant=test_wind_farm, **parameters)
+        test_tc_mc.run_model(self.weather_df)
+
+        # Changed efficiency of the same wind farm
+        test_wind_farm.efficiency = 0.5
+        test_tc_mc.run_model(self.weather_df)
+        exp_wind_farm = wf.WindFarm(**self.test_farm)
+        exp_wind_farm.efficiency = 0.5
+        power_output_exp = tc_mc.TurbineClusterModelChain(
+            power_plant=exp_wind_farm, **parameters).run_model(
+            self.weather_df).power_output
+        assert_series_equal(test_tc_mc.power_output, power_output_exp)
+
+    def test_run_model_new_power_plant(self):
+        parameters = {'wake_losses_model': 'constant_efficiency'}
+        test_wind_farm = wf.WindFarm(**self.test_farm)
+        test_wind_farm.efficiency = 0.9
+        test_tc_mc = tc_mc.TurbineClusterModelChain(
+            power_plant=test_wind_farm, **parameters)
+        test_tc_mc.run_model(self.weather_df)
+
+        test_wind_farm_2 = wf.WindFarm(**self.test_farm_2)
+        test_wind_farm_2.efficiency = 0.9
+        test_tc_mc.power_plant = test_wind_farm_2
+        test_tc_mc.run_model(self.weather_df)
+        exp_wind_farm = wf.WindFarm(**self.test_farm_2)
+        exp_wind_farm.efficiency = 0.9
+        power_output_exp = tc_mc.TurbineClusterModelChain(
+            power_plant=exp_wind_farm, **parameters).run_model(
+            self.weather_df).power_output
+        assert_series_equal(test_tc_mc.power_output, power_output_exp)
+
+    def test_run_model_prepared(self):
+        test_tc_mc = tc_mc.TurbineClusterModelChain(
+            power_plant=wf.WindFarm(**self.test_farm))
+        power_output_exp = test_tc_mc.run_model(self.weather_df).power_output
+        test_tc_mc = tc_mc.TurbineClusterModelChain(
+            power_plant=wf.WindFarm(**self.test_farm))
+        assert test_tc_mc.prepared is False
+        test_tc_mc.prepare(self.weather_df)
+        assert test_tc_mc.prepared is True
+        test_tc_mc.run_model_prepared(self.weather_df)
+        assert_series_equal(test_tc_mc.power_output, power_output_exp)
+
+    def test_run_model_prepared_changed_parameters(self):
+        test_wind_farm = wf.WindFarm(**self.test_farm)
+        test_wind_farm.efficiency = 0.5
+        test_tc_mc = tc_mc.TurbineClusterModelChain(
+            power_plant=test_wind_farm,
+            wake_losses_model='constant_efficiency')
+        test_tc_mc.prepare(self.weather_df)
+        # Changed wake losses model
+        test_tc_mc.wake_losses_model = 'dena_mean'
+        test_tc_mc.run_model_prepared(self.weather_df)
+        power_output_exp = tc_mc.TurbineClusterModelChain(
+            power_plant=wf.WindFarm(**self.test_farm),
+            wake_losses_model='dena_mean').run_model(
+            self.weather_df).power_output
+        assert_series_equal(test_tc_mc.power_output, power_output_exp)
+        # New power plant
+        test_tc_mc.power_plant = wf.WindFarm(**self.test_farm_2)
+        test_tc_mc.run_model_prepared(self.weather_df)
+        power_output_exp = tc_mc.TurbineClusterModelChain(
+            power_plant=wf.WindFarm(**self.test_farm_2),
+            wake_losses_model='dena_mean').run_model(
+            self.weather_df).power_output
+        assert_series_equal(test_tc_mc.power_output, power_output_exp)
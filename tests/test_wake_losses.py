@@ -24,6 +24,13 @@ class TestWakeLosses:
             24.958125])
         assert_series_equal(reduce_wind_speed(**parameters), wind_speed_exp)
 
+        # Pre-loaded wind efficiency curve
+        parameters['wind_efficiency_curve'] = get_wind_efficiency_curve(
+            'dena_mean')
+        parameters['wind_efficiency_curve_name'] = None
+        assert_series_equal(reduce_wind_speed(**parameters), wind_speed_exp)
+        del parameters['wind_efficiency_curve']
+
         # Raise ValueError - misspelling
         with pytest.raises(ValueError):
             parameters['wind_efficiency_curve_name'] = 'misspelled'
@@ -0,0 +1,41 @@
+from pandas.util.testing import assert_frame_equal
+
+import windpowerlib.wind_farm as wf
+import windpowerlib.wind_turbine as wt
+
+
+class TestWindFarm:
+
+    @classmethod
+    def setup_class(self):
+        self.test_turbine = {'hub_height': 100,
+                             'rotor_diameter': 80,
+                             'name': 'E-126/4200',
+                             'fetch_curve': 'power_curve'}
+        self.parameters = {'wake_losses_model': None,
+                           'smoothing': True,
+                           'standard_deviation_method': 'Staffell_Pfenninger',
+                           'smoothing_order': 'turbine_power_curves'}
+
+    def test_assign_power_curve_same_turbine(self):
+        # Fleet with the same wind turbine object in several entries
+        test_turbine = wt.WindTurbine(**self.test_turbine)
+        test_farm = wf.WindFarm(
+            name='test farm',
+            wind_turbine_fleet=[
+                {'wind_turbine': test_turbine, 'number_of_turbines': 1},
+                {'wind_turbine': test_turbine, 'number_of_turbines': 2}])
+        test_farm.mean_hub_height()
+        test_farm.assign_power_curve(**self.parameters)
+
+        # Fleet with separate wind turbine objects of the same type
+        exp_farm = wf.WindFarm(
+            name='test farm',
+            wind_turbine_fleet=[
+                {'wind_turbine': wt.WindTurbine(**self.test_turbine),
+                 'number_of_turbines': 1},
+                {'wind_turbine': wt.WindTurbine(**self.test_turbine),
+                 'number_of_turbines': 2}])
+        exp_farm.mean_hub_height()
+        exp_farm.assign_power_curve(**self.parameters)
+        assert_frame_equal(test_farm.power_curve, exp_farm.power_curve)
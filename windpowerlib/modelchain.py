@@ -9,6 +9,8 @@ __copyright__ = "Copyright oemof developer group"
 __license__ = "GPLv3"
 
 import logging
+import numpy as np
+import pandas as pd
 from windpowerlib import (wind_speed, density, temperature, power_output,
                           tools)
 
@@ -120,6 +122,9 @@ class ModelChain(object):
         self.density_correction = density_correction
         self.hellman_exp = hellman_exp
         self.power_output = None
+        # (power curve, wind speeds, values) with the power curve wind speeds
+        # and values as float64 arrays, if assigned
+        self._power_curve_arrays = None
 
     def temperature_hub(self, weather_df):
         r"""
@@ -130,7 +135,7 @@ class ModelChain(object):
 
         Parameters
         ----------
-        weather_df : pandas.DataFrame
+        weather_df : pandas.DataFrame or dict
             DataFrame with time series for temperature `temperature` in K.
             The columns of the DataFrame are a MultiIndex where the first level
             contains the variable name (e.g. temperature) and the second level
@@ -138,6 +143,9 @@ class ModelChain(object):
             measured at a height of 10 m). See documentation of
             :func:`ModelChain.run_model` for an example on how to create the
             weather_df DataFrame.
+            Instead of a DataFrame a dictionary with the variable names as
+            keys and the respective columns (e.g. `weather_df['temperature']`)
+            as values can be passed.
 
         Returns
         -------
@@ -185,7 +193,7 @@ class ModelChain(object):
 
         Parameters
         ----------
-        weather_df : pandas.DataFrame
+        weather_df : pandas.DataFrame or dict
             DataFrame with time series for temperature `temperature` in K,
             pressure `pressure` in Pa and/or density `density` in kg/m³,
             depending on the `density_model` used.
@@ -195,6 +203,9 @@ class ModelChain(object):
             measured at a height of 10 m). See documentation of
             :func:`ModelChain.run_model` for an example on how to create the
             weather_df DataFrame.
+            Instead of a DataFrame a dictionary with the variable names as
+            keys and the respective columns (e.g. `weather_df['temperature']`)
+            as values can be passed.
 
         Returns
         -------
@@ -252,7 +263,7 @@ class ModelChain(object):
 
         Parameters
         ----------
-        weather_df : pandas.DataFrame
+        weather_df : pandas.DataFrame or dict
             DataFrame with time series for wind speed `wind_speed` in m/s and
             roughness length `roughness_length` in m.
             The columns of the DataFrame are a MultiIndex where the first level
@@ -261,6 +272,9 @@ class ModelChain(object):
             measured at a height of 10 m). See documentation of
             :func:`ModelChain.run_model` for an example on how to create the
             weather_df DataFrame.
+            Instead of a DataFrame a dictionary with the variable names as
+            keys and the respective columns (e.g. `weather_df['wind_speed']`)
+            as values can be passed.
 
         Returns
         -------
@@ -316,6 +330,86 @@ class ModelChain(object):
                 "or 'log_interpolation_extrapolation'.")
         return wind_speed_hub
 
+    def _compute_hub_state(self, weather_df):
+        r"""
+        Calculates wind speed and density at hub height.
+
+        The columns of each weather variable are selected from `weather_df`
+        only once and shared by the wind speed and density calculations.
+
+        Parameters
+        ----------
+        weather_df : pandas.DataFrame
+            See :func:`run_model`.
+
+        Returns
+        -------
+        tuple
+            Wind speed at hub height (see :func:`wind_speed_hub`) and density
+            at hub height (see :func:`_density_hub_for_power_output`).
+
+        """
+        # The hub height methods only select variables by name, so a
+        # dictionary of the selected columns can be passed instead of
+        # `weather_df`
+        variables = ('wind_speed', 'roughness_length')
+        if self._density_needed():
+            variables += ('temperature', 'pressure', 'density')
+        weather_variables = {
+            variable: weather_df[variable] for variable in variables
+            if variable in weather_df}
+        wind_speed_hub = self.wind_speed_hub(weather_variables)
+        density_hub = self._density_hub_for_power_output(
+            weather_df, weather_variables=weather_variables)
+        return wind_speed_hub, density_hub
+
+    def _density_needed(self):
+        r"""
+        Checks if the density at hub height is needed for the power output.
+
+        Returns
+        -------
+        bool
+            False if `power_output_model` is 'power_curve' without density
+            correction, True otherwise.
+
+        """
+        return not (self.power_output_model == 'power_curve' and
+                    self.density_correction is False)
+
+    def _density_hub_for_power_output(self, weather_df,
+                                      weather_variables=None):
+        r"""
+        Calculates the density at hub height if needed for the power output.
+
+        Parameters
+        ----------
+        weather_df : pandas.DataFrame
+            See :func:`density_hub`.
+        weather_variables : dict or None
+            Columns of `weather_df` already selected by variable name. Used
+            instead of `weather_df` for the calculation if given.
+            Default: None.
+
+        Returns
+        -------
+        pandas.Series or numpy.array or float or None
+            Density of air in kg/m³ at hub height. A float is returned if the
+            density is constant, None if the density is not needed by
+            `power_output_model`.
+
+        """
+        if not self._density_needed():
+            return None
+        density_hub = self.density_hub(
+            weather_df if weather_variables is None else weather_variables)
+        # Pass a scalar instead of a time series if the density is constant
+        density_values = np.asarray(density_hub)
+        if (density_values.size > 0 and
+                np.ptp(density_values) < 1e-9):
+            density_hub = float(density_values.flat[0])
+        return density_hub
+
     def calculate_power_output(self, wind_speed_hub, density_hub):
         r"""
         Calculates the power output of the wind power plant.
@@ -326,7 +420,7 @@ class ModelChain(object):
         ----------
         wind_speed_hub : pandas.Series or numpy.array
             Wind speed at hub height in m/s.
-        density_hub : pandas.Series or numpy.array
+        density_hub : pandas.Series or numpy.array or float
             Density of air at hub height in kg/m³.
 
         Returns
@@ -341,11 +435,21 @@ class ModelChain(object):
                                 self.power_plant.name +
                                 " are missing.")
             logging.debug('Calculating power output using power curve.')
+            # The arrays are only used if the power curve is still the one
+            # they were created from
+            if (self._power_curve_arrays is not None and
+                    self._power_curve_arrays[0] is
+                    self.power_plant.power_curve):
+                power_curve_wind_speeds, power_curve_values = (
+                    self._power_curve_arrays[1:])
+            else:
+                power_curve_wind_speeds = (
+                    self.power_plant.power_curve['wind_speed'])
+                power_curve_values = self.power_plant.power_curve['value']
             return (power_output.power_curve(
-                        wind_speed_hub,
-                        self.power_plant.power_curve['wind_speed'],
-                        self.power_plant.power_curve['value'],
-                        density_hub, self.density_correction))
+                        wind_speed_hub, power_curve_wind_speeds,
+                        power_curve_values, density_hub,
+                        self.density_correction))
         elif self.power_output_model == 'power_coefficient_curve':
             if self.power_plant.power_coefficient_curve is None:
                 raise TypeError("Power coefficient curve values of " +
@@ -415,10 +519,49 @@ class ModelChain(object):
         'wind_speed'
 
         """
-        wind_speed_hub = self.wind_speed_hub(weather_df)
-        density_hub = (None if (self.power_output_model == 'power_curve' and
-                                self.density_correction is False)
-                       else self.density_hub(weather_df))
+        wind_speed_hub, density_hub = self._compute_hub_state(weather_df)
         self.power_output = self.calculate_power_output(wind_speed_hub,
                                                         density_hub)
         return self
+
+    def run_model_batch(self, weather_dfs):
+        r"""
+        Runs the model for several weather data sets.
+
+        This is the recommended way for multi-year or multi-scenario runs as
+        the power output is written into one pre-allocated array instead of
+        concatenating the results of single :func:`run_model` calls.
+
+        Parameters
+        ----------
+        weather_dfs : list(pandas.DataFrame)
+            List of weather DataFrames as described in :func:`run_model`. Must
+            contain at least one DataFrame.
+
+        Returns
+        -------
+        self
+
+        Notes
+        -----
+        :py:attr:`~power_output` contains the power output of all weather data
+        sets in the order of `weather_dfs`. Its index is the concatenation of
+        the indices of `weather_dfs`.
+
+        """
+        if len(weather_dfs) == 0:
+            raise ValueError("`weather_dfs` is empty. At least one weather "
+                             "DataFrame is needed to run the model.")
+        total_length = sum(len(weather_df) for weather_df in weather_dfs)
+        power_output_values = np.empty(total_length)
+        offset = 0
+        for weather_df in weather_dfs:
+            self.run_model(weather_df)
+            power_output_values[offset:offset + len(weather_df)] = np.asarray(
+                self.power_output)
+            offset += len(weather_df)
+        index = weather_dfs[0].index.append(
+            [weather_df.index for weather_df in weather_dfs[1:]])
+        self.power_output = pd.Series(data=power_output_values, index=index,
+                                      name='feedin_power_plant')
+        return self
@@ -128,48 +128,45 @@ def smooth_power_curve(power_curve_wind_speeds, power_curve_values,
                          + "options are 'turbulence_intensity', or "
                          + "'Staffell_Pfenninger'".format(
                                  standard_deviation_method))
-    # Initialize list for power curve values
-    smoothed_power_curve_values = []
     # Append wind speeds to `power_curve_wind_speeds`
-    maximum_value = power_curve_wind_speeds.values[-1] + wind_speed_range
-    while power_curve_wind_speeds.values[-1] < maximum_value:
-        power_curve_wind_speeds = power_curve_wind_speeds.append(
-            pd.Series(power_curve_wind_speeds.iloc[-1] + 0.5,
-                      index=[power_curve_wind_speeds.index[-1] + 1]))
-        power_curve_values = power_curve_values.append(
-            pd.Series(0.0, index=[power_curve_values.index[-1] + 1]))
-    for power_curve_wind_speed in power_curve_wind_speeds:
-        # Create array of wind speeds for the sum
-        wind_speeds_block = (np.arange(
-            -wind_speed_range, wind_speed_range + block_width, block_width) +
-            power_curve_wind_speed)
-        # Get standard deviation for Gauss function
-        standard_deviation = (
-            (power_curve_wind_speed * normalized_standard_deviation + 0.6)
-            if standard_deviation_method is 'Staffell_Pfenninger'
-            else power_curve_wind_speed * normalized_standard_deviation)
-        # Get the smoothed value of the power output
-        if standard_deviation == 0.0:
-            # The gaussian distribution is not defined for a standard deviation
-            # of zero. Smoothed power curve value is set to zero.
-            smoothed_value = 0.0
-        else:
-            smoothed_value = sum(
-                block_width * np.interp(wind_speed, power_curve_wind_speeds,
-                                        power_curve_values, left=0, right=0) *
-                tools.gauss_distribution(
-                    power_curve_wind_speed - wind_speed,
-                    standard_deviation, mean_gauss)
-                for wind_speed in wind_speeds_block)
-        # Add value to list - add zero if `smoothed_value` is nan as Gauss
-        # distribution for a standard deviation of zero.
-        smoothed_power_curve_values.append(smoothed_value)
+    power_curve_wind_speeds = list(power_curve_wind_speeds)
+    power_curve_values = list(power_curve_values)
+    maximum_value = power_curve_wind_speeds[-1] + wind_speed_range
+    while power_curve_wind_speeds[-1] < maximum_value:
+        power_curve_wind_speeds.append(power_curve_wind_speeds[-1] + 0.5)
+        power_curve_values.append(0.0)
+    power_curve_wind_speeds = np.array(power_curve_wind_speeds,
+                                       dtype=np.float64)
+    power_curve_values = np.array(power_curve_values, dtype=np.float64)
+    # Create array of wind speeds for the sum (one row per power curve wind
+    # speed)
+    wind_speeds_block = (
+        np.arange(-wind_speed_range, wind_speed_range + block_width,
+                  block_width)[np.newaxis, :] +
+        power_curve_wind_speeds[:, np.newaxis])
+    # Get standard deviation for Gauss function
+    standard_deviations = (
+        (power_curve_wind_speeds * normalized_standard_deviation + 0.6)
+        if standard_deviation_method == 'Staffell_Pfenninger'
+        else power_curve_wind_speeds * normalized_standard_deviation)
+    # The gaussian distribution is not defined for a standard deviation of
+    # zero. Smoothed power curve values are set to zero in this case.
+    defined = standard_deviations != 0.0
+    # Get the smoothed values of the power output
+    smoothed_power_curve_values = np.zeros(len(power_curve_wind_speeds))
+    smoothed_power_curve_values[defined] = (
+        block_width * np.interp(wind_speeds_block[defined],
+                                power_curve_wind_speeds,
+                                power_curve_values, left=0, right=0) *
+        tools.gauss_distribution(
+            power_curve_wind_speeds[defined, np.newaxis] -
+            wind_speeds_block[defined],
+            standard_deviations[defined, np.newaxis], mean_gauss)).sum(axis=1)
     # Create smoothed power curve data frame
     smoothed_power_curve_df = pd.DataFrame(
-        data=[list(power_curve_wind_speeds.values),
-              smoothed_power_curve_values]).transpose()
-    # Rename columns of the data frame
-    smoothed_power_curve_df.columns = ['wind_speed', 'value']
+        data={'wind_speed': power_curve_wind_speeds,
+              'value': smoothed_power_curve_values},
+        columns=['wind_speed', 'value'])
     return smoothed_power_curve_df
 
 
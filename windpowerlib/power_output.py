@@ -10,6 +10,9 @@ __license__ = "GPLv3"
 import numpy as np
 import pandas as pd
 
+# Number of time steps processed at once by vectorized kernels
+_CHUNK_SIZE = 8192
+
 
 def power_coefficient_curve(wind_speed, power_coefficient_curve_wind_speeds,
                             power_coefficient_curve_values, rotor_diameter,
@@ -33,7 +36,7 @@ def power_coefficient_curve(wind_speed, power_coefficient_curve_wind_speeds,
         `power_coefficient_curve_wind_speeds`.
     rotor_diameter : float
         Rotor diameter in m.
-    density : pandas.Series or numpy.array
+    density : pandas.Series or numpy.array or float
         Density of air at hub height in kg/m³.
 
     Returns
@@ -101,7 +104,7 @@ def power_curve(wind_speed, power_curve_wind_speeds, power_curve_values,
     power_curve_values : pandas.Series or numpy.array
         Power curve values corresponding to wind speeds in
         `power_curve_wind_speeds`.
-    density : pandas.Series or numpy.array
+    density : pandas.Series or numpy.array or float
         Density of air at hub height in kg/m³. This parameter is needed
         if `density_correction` is True. Default: None.
     density_correction : boolean
@@ -122,8 +125,11 @@ def power_curve(wind_speed, power_curve_wind_speeds, power_curve_values,
 
     """
     if density_correction is False:
-        power_output = np.interp(wind_speed, power_curve_wind_speeds,
-                                 power_curve_values, left=0, right=0)
+        power_output = np.interp(
+            wind_speed,
+            np.ascontiguousarray(power_curve_wind_speeds, dtype=np.float64),
+            np.ascontiguousarray(power_curve_values, dtype=np.float64),
+            left=0, right=0)
         # Power_output as pd.Series if wind_speed is pd.Series (else: np.array)
         if isinstance(wind_speed, pd.Series):
             power_output = pd.Series(data=power_output, index=wind_speed.index,
@@ -158,7 +164,7 @@ def power_curve_density_correction(wind_speed, power_curve_wind_speeds,
     power_curve_values : pandas.Series or numpy.array
         Power curve values corresponding to wind speeds in
         `power_curve_wind_speeds`.
-    density : pandas.Series or numpy.array
+    density : pandas.Series or numpy.array or float
         Density of air at hub height in kg/m³.
 
     Returns
@@ -212,10 +218,23 @@ def power_curve_density_correction(wind_speed, power_curve_wind_speeds,
         raise TypeError("`density` is None. For the calculation with a " +
                         "density corrected power curve density at hub " +
                         "height is needed.")
-    power_output = [(np.interp(
-        wind_speed[i], power_curve_wind_speeds * (1.225 / density[i]) ** (
-            np.interp(power_curve_wind_speeds, [7.5, 12.5], [1/3, 2/3])),
-        power_curve_values, left=0, right=0)) for i in range(len(wind_speed))]
+    wind_speed_arr = np.asarray(wind_speed, dtype=np.float64)
+    density_arr = np.broadcast_to(np.asarray(density), wind_speed_arr.shape)
+    power_curve_wind_speeds = np.asarray(power_curve_wind_speeds,
+                                         dtype=np.float64)
+    power_curve_values = np.asarray(power_curve_values, dtype=np.float64)
+    exponents = np.interp(power_curve_wind_speeds, [7.5, 12.5], [1/3, 2/3])
+    power_output = np.empty(len(wind_speed_arr))
+    # The density corrected power curve differs for each time step. It is
+    # evaluated for blocks of time steps to limit the size of temporaries.
+    for start in range(0, len(wind_speed_arr), _CHUNK_SIZE):
+        stop = start + _CHUNK_SIZE
+        power_output[start:stop] = _interp_rows(
+            wind_speed_arr[start:stop],
+            power_curve_wind_speeds[np.newaxis, :] * (
+                1.225 / density_arr[start:stop, np.newaxis]) **
+            exponents[np.newaxis, :],
+            power_curve_values)
 
     # Power_output as pd.Series if wind_speed is pd.Series (else: np.array)
     if isinstance(wind_speed, pd.Series):
@@ -224,3 +243,42 @@ def power_curve_density_correction(wind_speed, power_curve_wind_speeds,
     else:
         power_output = np.array(power_output)
     return power_output
+
+
+def _interp_rows(x, xp, fp):
+    r"""
+    Row-wise linear interpolation with a different grid for each row.
+
+    Equivalent to ``np.interp(x[i], xp[i], fp, left=0, right=0)`` for every
+    row `i`. Missing values in `x` or `xp` result in nan.
+
+    Parameters
+    ----------
+    x : numpy.array
+        Values to interpolate at, shape (n,).
+    xp : numpy.array
+        Increasing grid for each value in `x`, shape (n, m).
+    fp : numpy.array
+        Values corresponding to the grid points, shape (m,).
+
+    Returns
+    -------
+    numpy.array
+        Interpolated values, shape (n,).
+
+    """
+    # Index of the last grid point that is smaller than or equal to x
+    idx = (xp <= x[:, np.newaxis]).sum(axis=1) - 1
+    rows = np.arange(len(x))
+    lower = np.clip(idx, 0, xp.shape[1] - 2)
+    x_lower = xp[rows, lower]
+    # Repeated grid points and nan are handled below
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = ((fp[lower + 1] - fp[lower]) /
+                 (xp[rows, lower + 1] - x_lower))
+        result = slope * (x - x_lower) + fp[lower]
+    # Exact match of the last grid point
+    result = np.where(idx == xp.shape[1] - 1, fp[-1], result)
+    # Values outside of the grid are zero
+    result = np.where((idx < 0) | (x > xp[:, -1]), 0.0, result)
+    return np.where(np.isnan(x) | np.isnan(xp).any(axis=1), np.nan, result)
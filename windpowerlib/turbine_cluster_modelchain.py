@@ -10,8 +10,57 @@ __copyright__ = "Copyright oemof developer group"
 __license__ = "GPLv3"
 
 import logging
+import numpy as np
 from windpowerlib import wake_losses
 from windpowerlib.modelchain import ModelChain
+from windpowerlib.wind_turbine_cluster import WindTurbineCluster
+
+# Wake losses models that are applied to the aggregated power curve
+_PC_WAKE_MODELS = frozenset({'power_efficiency_curve', 'constant_efficiency'})
+
+
+def _power_plant_state(power_plant):
+    r"""
+    Returns the objects and values the aggregated power curve depends on.
+
+    Parameters
+    ----------
+    power_plant : :class:`~.wind_farm.WindFarm` or :class:`~.wind_turbine_cluster.WindTurbineCluster`
+        The power plant.
+
+    Returns
+    -------
+    list
+        Power plant, wind farms, their efficiencies and the wind turbines
+        with their number, power curve, hub height and nominal power.
+
+    """
+    wind_farms = (power_plant.wind_farms if
+                  isinstance(power_plant, WindTurbineCluster) else
+                  [power_plant])
+    state = [power_plant]
+    for farm in wind_farms:
+        state.extend([farm, farm.efficiency])
+        for item in farm.wind_turbine_fleet:
+            wind_turbine = item['wind_turbine']
+            state.extend([wind_turbine, item['number_of_turbines'],
+                          wind_turbine.power_curve, wind_turbine.hub_height,
+                          wind_turbine.nominal_power])
+    return state
+
+
+def _is_same_state(state, other_state):
+    r"""
+    Checks if two results of :func:`_power_plant_state` are equal.
+
+    Objects are compared by identity, scalars by value.
+
+    """
+    return len(state) == len(other_state) and all(
+        item is other_item or (np.isscalar(item) and
+                               np.isscalar(other_item) and
+                               item == other_item)
+        for item, other_item in zip(state, other_state))
 
 
 class TurbineClusterModelChain(ModelChain):
@@ -108,6 +157,8 @@ class TurbineClusterModelChain(ModelChain):
         Electrical power output of the wind turbine in W.
     power_curve : :pandas:`pandas.Dataframe<frame>` or None
         The calculated power curve of the wind farm.
+    prepared : bool
+        True if the power plant has been prepared by :func:`prepare`.
     wind_speed_model : str
         Parameter to define which model to use to calculate the wind speed
         at hub height. Valid options are 'logarithmic', 'hellman' and
@@ -151,6 +202,96 @@ class TurbineClusterModelChain(ModelChain):
 
         self.power_curve = None
         self.power_output = None
+        self.prepared = False
+        # Power curve parameters and power plant state used in `prepare`
+        self._prepared_state = None
+        # (key, power plant state, power curve, wind speed and value arrays)
+        # of the last aggregated power curve
+        self._pc_cache = None
+        # True if the mean hub height of the power plant has been calculated
+        self._hub_height_ready = False
+        # Wind efficiency curve arrays, loaded on first use
+        self._wec_name = None
+        self._wec_ws = None
+        self._wec_eff = None
+
+    def invalidate_cache(self):
+        r"""
+        Clears all cached intermediate results of the model chain.
+
+        Must be called if power curves of the wind turbines are altered in
+        place after the first call of :func:`assign_power_curve` or
+        :func:`run_model`, as such changes are not detected by the cache of
+        the aggregated power curve.
+
+        Returns
+        -------
+        self
+
+        """
+        self._pc_cache = None
+        self._power_curve_arrays = None
+        self._hub_height_ready = False
+        self.prepared = False
+        self._wec_name = None
+        return self
+
+    @property
+    def wake_losses_model(self):
+        r"""
+        The method for taking wake losses into consideration.
+
+        Setting the attribute also classifies the method: 'none' (no wake
+        losses), 'pc' (applied to the aggregated power curve) or 'curve'
+        (wind speed reduced by a wind efficiency curve).
+
+        """
+        return self._wake_losses_model
+
+    @wake_losses_model.setter
+    def wake_losses_model(self, wake_losses_model):
+        self._wake_losses_model = wake_losses_model
+        if wake_losses_model is None:
+            self._wake_mode = 'none'
+        elif wake_losses_model in _PC_WAKE_MODELS:
+            self._wake_mode = 'pc'
+        else:
+            self._wake_mode = 'curve'
+
+    def _power_curve_parameters(self):
+        r"""
+        Returns the parameters the aggregated power curve depends on.
+
+        Returns
+        -------
+        tuple
+            `wake_losses_model`, `smoothing`, `block_width`,
+            `standard_deviation_method` and `smoothing_order`.
+
+        """
+        return (self.wake_losses_model, self.smoothing, self.block_width,
+                self.standard_deviation_method, self.smoothing_order)
+
+    def _wind_efficiency_curve(self):
+        r"""
+        Returns the wind efficiency curve of `wake_losses_model` as arrays.
+
+        The curve is read from file only once per curve name.
+
+        Returns
+        -------
+        dict
+            Wind speeds in m/s ('wind_speed') and the corresponding wind
+            efficiencies ('efficiency') as numpy.arrays.
+
+        """
+        if self._wec_name != self.wake_losses_model:
+            wind_efficiency_curve = wake_losses.get_wind_efficiency_curve(
+                curve_name=self.wake_losses_model)
+            self._wec_ws = wind_efficiency_curve['wind_speed'].values
+            self._wec_eff = wind_efficiency_curve['efficiency'].values
+            self._wec_name = self.wake_losses_model
+        return {'wind_speed': self._wec_ws, 'efficiency': self._wec_eff}
 
     def assign_power_curve(self, weather_df):
         r"""
@@ -181,25 +322,56 @@ class TurbineClusterModelChain(ModelChain):
         -------
         self
 
+        Notes
+        -----
+        The last aggregated power curve is cached together with
+        `wake_losses_model`, `smoothing`, `block_width`,
+        `standard_deviation_method`, `smoothing_order`, the turbulence
+        intensity and the power plant, so repeated calls with unchanged
+        parameters do not aggregate the power curves again. A new power plant
+        or changed wind farm efficiencies, fleets, turbine power curve objects
+        or hub heights are detected. Power curves altered in place are not
+        detected; use :func:`invalidate_cache` after altering them.
+
         """
-        # Get turbulence intensity from weather if existent
-        turbulence_intensity = (
-            weather_df['turbulence_intensity'].values.mean() if
-            'turbulence_intensity' in
-            weather_df.columns.get_level_values(0) else None)
+        # Get turbulence intensity from weather if existent (membership is
+        # checked on the unique variable names of the first column level)
+        turbulence_intensity = None
+        if 'turbulence_intensity' in weather_df.columns.levels[0]:
+            # Select columns by position to avoid MultiIndex slicing,
+            # missing values are ignored
+            mask = (weather_df.columns.get_level_values(0) ==
+                    'turbulence_intensity')
+            # Levels may contain unused values after column selection
+            if mask.any():
+                turbulence_intensity = float(
+                    np.nanmean(weather_df.values[:, mask]))
+        # Use cached power curve if parameters and power plant are unchanged
+        pc_key = self._power_curve_parameters() + (
+            None if turbulence_intensity is None
+            else round(turbulence_intensity, 6),)
+        power_plant_state = _power_plant_state(self.power_plant)
+        if (self._pc_cache is not None and self._pc_cache[0] == pc_key and
+                _is_same_state(self._pc_cache[1], power_plant_state)):
+            logging.debug('Using cached aggregated power curve.')
+            self.power_plant.power_curve = self._pc_cache[2].copy()
+            self._power_curve_arrays = (
+                (self.power_plant.power_curve,) + self._pc_cache[3])
+            return self
+        # The power plant may have changed, so its mean hub height is
+        # calculated again
+        self._hub_height_ready = False
         # Assign power curve
-        if (self.wake_losses_model == 'power_efficiency_curve' or
-                self.wake_losses_model == 'constant_efficiency' or
-                self.wake_losses_model is None):
+        if self._wake_mode == 'none':
+            logging.debug('Wake losses in wind farms are not considered.')
+            wake_losses_model_to_power_curve = None
+        elif self._wake_mode == 'pc':
+            logging.debug('Wake losses considered with %s.',
+                          self.wake_losses_model)
             wake_losses_model_to_power_curve = self.wake_losses_model
-            if self.wake_losses_model is None:
-                logging.debug('Wake losses in wind farms are not considered.')
-            else:
-                logging.debug('Wake losses considered with {}.'.format(
-                    self.wake_losses_model))
         else:
-            logging.debug('Wake losses considered by {} wind '.format(
-                self.wake_losses_model) + 'efficiency curve.')
+            logging.debug('Wake losses considered by %s wind efficiency '
+                          'curve.', self.wake_losses_model)
             wake_losses_model_to_power_curve = None
         self.power_plant.assign_power_curve(
             wake_losses_model=wake_losses_model_to_power_curve,
@@ -207,11 +379,28 @@ class TurbineClusterModelChain(ModelChain):
             standard_deviation_method=self.standard_deviation_method,
             smoothing_order=self.smoothing_order,
             turbulence_intensity=turbulence_intensity)
+        # Keep the power curve as arrays for the power output calculation
+        power_curve_arrays = (
+            np.ascontiguousarray(
+                self.power_plant.power_curve['wind_speed'].values,
+                dtype=np.float64),
+            np.ascontiguousarray(
+                self.power_plant.power_curve['value'].values,
+                dtype=np.float64))
+        self._power_curve_arrays = (
+            (self.power_plant.power_curve,) + power_curve_arrays)
+        # A nan turbulence intensity (no valid values) is not cached
+        if turbulence_intensity is None or not np.isnan(turbulence_intensity):
+            self._pc_cache = (pc_key, power_plant_state,
+                              self.power_plant.power_curve.copy(),
+                              power_curve_arrays)
+        else:
+            self._pc_cache = None
         # Further logging messages
         if self.smoothing is None:
             logging.debug('Aggregated power curve not smoothed.')
         else:
-            logging.debug('Aggregated power curve smoothed by method: ' +
+            logging.debug('Aggregated power curve smoothed by method: %s',
                           self.standard_deviation_method)
 
         return self
@@ -259,20 +448,91 @@ class TurbineClusterModelChain(ModelChain):
         'wind_speed'
 
         """
+        self.prepare(weather_df)
+        return self.run_model_prepared(weather_df)
+
+    def prepare(self, weather_df):
+        r"""
+        Prepares the power plant for the power output calculation.
 
+        Assigns the aggregated power curve (see :func:`assign_power_curve`)
+        and the mean hub height to the power plant. Afterwards
+        :func:`run_model_prepared` can be called for several weather data sets
+        without aggregating the power curves again.
+
+        Parameters
+        ----------
+        weather_df : pandas.DataFrame
+            DataFrame with time series for wind speed `wind_speed` in m/s, and
+            roughness length `roughness_length` in m, as well as optionally
+            temperature `temperature` in K, pressure `pressure` in Pa,
+            density `density` in kg/m³ and turbulence intensity
+            `turbulence_intensity` depending on `power_output_model`,
+            `density_model` and `standard_deviation_model` chosen.
+            The columns of the DataFrame are a MultiIndex where the first level
+            contains the variable name (e.g. wind_speed) and the second level
+            contains the height at which it applies (e.g. 10, if it was
+            measured at a height of 10 m). See documentation of
+            :func:`TurbineClusterModelChain.run_model` for an example on how
+            to create the weather_df DataFrame.
+
+        Returns
+        -------
+        self
+
+        """
         self.assign_power_curve(weather_df)
-        self.power_plant.mean_hub_height()
-        wind_speed_hub = self.wind_speed_hub(weather_df)
-        density_hub = (None if (self.power_output_model == 'power_curve' and
-                                self.density_correction is False)
-                       else self.density_hub(weather_df))
-        if (self.wake_losses_model != 'power_efficiency_curve' and
-                self.wake_losses_model != 'constant_efficiency' and
-                self.wake_losses_model is not None):
+        # The mean hub height only depends on the power plant
+        if not self._hub_height_ready:
+            self.power_plant.mean_hub_height()
+            self._hub_height_ready = True
+        self._prepared_state = (self._power_curve_parameters(),
+                                _power_plant_state(self.power_plant))
+        self.prepared = True
+        return self
+
+    def run_model_prepared(self, weather_df):
+        r"""
+        Runs the model with the power curve assigned in :func:`prepare`.
+
+        Use this method to calculate the power output for many weather data
+        sets with an unchanged power plant configuration. If :func:`prepare`
+        has not been called yet, or the power plant or the parameters of the
+        aggregated power curve changed since then, it is called with
+        `weather_df`.
+
+        Parameters
+        ----------
+        weather_df : pandas.DataFrame
+            DataFrame with time series for wind speed `wind_speed` in m/s, and
+            roughness length `roughness_length` in m, as well as optionally
+            temperature `temperature` in K, pressure `pressure` in Pa,
+            density `density` in kg/m³ and turbulence intensity
+            `turbulence_intensity` depending on `power_output_model`,
+            `density_model` and `standard_deviation_model` chosen.
+            The columns of the DataFrame are a MultiIndex where the first level
+            contains the variable name (e.g. wind_speed) and the second level
+            contains the height at which it applies (e.g. 10, if it was
+            measured at a height of 10 m). See documentation of
+            :func:`TurbineClusterModelChain.run_model` for an example on how
+            to create the weather_df DataFrame.
+
+        Returns
+        -------
+        self
+
+        """
+        if not self.prepared or not (
+                self._prepared_state[0] == self._power_curve_parameters() and
+                _is_same_state(self._prepared_state[1],
+                               _power_plant_state(self.power_plant))):
+            self.prepare(weather_df)
+        wind_speed_hub, density_hub = self._compute_hub_state(weather_df)
+        if self._wake_mode == 'curve':
             # Reduce wind speed with wind efficiency curve
             wind_speed_hub = wake_losses.reduce_wind_speed(
                 wind_speed_hub,
-                wind_efficiency_curve_name=self.wake_losses_model)
+                wind_efficiency_curve=self._wind_efficiency_curve())
         self.power_output = self.calculate_power_output(wind_speed_hub,
                                                         density_hub)
         return self
@@ -12,7 +12,8 @@ import pandas as pd
 import os
 
 
-def reduce_wind_speed(wind_speed, wind_efficiency_curve_name='dena_mean'):
+def reduce_wind_speed(wind_speed, wind_efficiency_curve_name='dena_mean',
+                      wind_efficiency_curve=None):
     r"""
     Reduces wind speed by a wind efficiency curve.
 
@@ -28,6 +29,10 @@ def reduce_wind_speed(wind_speed, wind_efficiency_curve_name='dena_mean'):
         Name of the wind efficiency curve. Use
         :py:func:`~.get_wind_efficiency_curve` to get all provided wind
         efficiency curves. Default: 'dena_mean'.
+    wind_efficiency_curve : pd.DataFrame or dict or None
+        Already loaded wind efficiency curve with 'wind_speed' and
+        'efficiency' entries. If given, `wind_efficiency_curve_name` is
+        ignored and the curve is not read from file. Default: None.
 
     Returns
     -------
@@ -47,12 +52,20 @@ def reduce_wind_speed(wind_speed, wind_efficiency_curve_name='dena_mean'):
 
     """
     # Get wind efficiency curve
-    wind_efficiency_curve = get_wind_efficiency_curve(
-        curve_name=wind_efficiency_curve_name)
-    # Reduce wind speed by wind efficiency
-    reduced_wind_speed = wind_speed * np.interp(
-        wind_speed, wind_efficiency_curve['wind_speed'],
-        wind_efficiency_curve['efficiency'])
+    if wind_efficiency_curve is None:
+        wind_efficiency_curve = get_wind_efficiency_curve(
+            curve_name=wind_efficiency_curve_name)
+    # Reduce wind speed by wind efficiency (on plain arrays, as np.interp is
+    # considerably faster without pandas overhead)
+    wind_speed_arr = np.ascontiguousarray(wind_speed, dtype=np.float64)
+    reduced_wind_speed = wind_speed_arr * np.interp(
+        wind_speed_arr, np.asarray(wind_efficiency_curve['wind_speed']),
+        np.asarray(wind_efficiency_curve['efficiency']))
+    # Reduced wind speed as pd.Series if wind_speed is pd.Series
+    if isinstance(wind_speed, pd.Series):
+        reduced_wind_speed = pd.Series(data=reduced_wind_speed,
+                                       index=wind_speed.index,
+                                       name=wind_speed.name)
     return reduced_wind_speed
 
 
@@ -273,6 +273,9 @@ class WindFarm(object):
                                      item['wind_turbine'].power_curve))
         # Initialize data frame for power curve values
         df = pd.DataFrame()
+        # Smoothed power curves by id of the original power curve, so that
+        # power curves used in several fleet entries are smoothed only once
+        smoothed_power_curves = {}
         for turbine_type_dict in self.wind_turbine_fleet:
             # Check if all needed parameters are available and/or assign them
             if smoothing:
@@ -304,10 +307,15 @@ class WindFarm(object):
                 turbine_type_dict['wind_turbine'].power_curve)
             # Editions to the power curves before the summation
             if smoothing and smoothing_order == 'turbine_power_curves':
-                power_curve = power_curves.smooth_power_curve(
-                    power_curve['wind_speed'], power_curve['value'],
-                    standard_deviation_method=standard_deviation_method,
-                    block_width=block_width, **kwargs)
+                curve_id = id(turbine_type_dict['wind_turbine'].power_curve)
+                if curve_id not in smoothed_power_curves:
+                    smoothed_power_curves[curve_id] = (
+                        power_curves.smooth_power_curve(
+                            power_curve['wind_speed'], power_curve['value'],
+                            standard_deviation_method=(
+                                standard_deviation_method),
+                            block_width=block_width, **kwargs))
+                power_curve = smoothed_power_curves[curve_id]
             else:
                 # Add value zero to start and end of curve as otherwise
                 # problems can occur during the aggregation